@@ -1,6 +1,6 @@
 """Dagster example project with CSV files and DuckDB."""
 
-from dagster import Definitions
+from dagster import Definitions, in_process_executor
 from dagster_example.resources import DuckDBResource
 from dagster_example.assets import (
     basic_assets,
@@ -26,11 +26,16 @@ resources = {
     "duckdb": DuckDBResource(database_path="data/warehouse/analytics.duckdb"),
 }
 
-# Create Definitions object
+# Create Definitions object. Ad-hoc materializations from the UI run the
+# implicit asset job, which would otherwise default to the multiprocess
+# executor — and DuckDB allows only one writing process per database file.
+# Running every job in-process keeps all steps on the shared pooled
+# connection, where cursors and MVCC provide the concurrency.
 defs = Definitions(
     assets=all_assets,
     resources=resources,
     jobs=[daily_analytics_job, etl_job, analytics_only_job],
     schedules=[daily_schedule],
     sensors=[sales_file_sensor, multi_file_sensor],
+    executor=in_process_executor,
 )
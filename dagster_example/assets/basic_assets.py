@@ -1,27 +1,57 @@
 """Basic assets demonstrating data loading from CSV to DuckDB."""
 
+import threading
+
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dagster import asset, AssetExecutionContext
 from dagster_example.resources import DuckDBResource
 
 
+# All raw sources, loaded as a batch: whichever raw_* asset runs first warms
+# the Parquet copies for the whole set in parallel
+RAW_SOURCES = {
+    "raw_customers": Path("data/raw/customers.csv"),
+    "raw_products": Path("data/raw/products.csv"),
+    "raw_sales": Path("data/raw/sales.csv"),
+}
+
+# Serializes whole batch loads: concurrent raw_* steps would otherwise race
+# on CREATE OR REPLACE VIEW for the same names, a catalog write-write
+# conflict under DuckDB's MVCC. The loads inside a batch still run in
+# parallel; only back-to-back batches queue up, and the second one finds
+# fresh Parquet copies and finishes with cheap view refreshes.
+_load_lock = threading.Lock()
+
+
+def _load_raw_sources(duckdb: DuckDBResource) -> dict:
+    """Load every raw CSV concurrently and return row counts by table name.
+
+    Each source gets its own cursor on the shared connection, so DuckDB's
+    multi-threaded CSV parser overlaps the three conversions instead of
+    running them back to back. Sources whose Parquet copy is already fresh
+    only pay a cheap view refresh, so repeat calls from the other raw_*
+    assets in the same run are nearly free.
+    """
+    with _load_lock, ThreadPoolExecutor(max_workers=len(RAW_SOURCES)) as pool:
+        futures = {
+            table_name: pool.submit(
+                duckdb.read_source_to_table, str(csv_path.absolute()), table_name
+            )
+            for table_name, csv_path in RAW_SOURCES.items()
+        }
+        return {table_name: future.result() for table_name, future in futures.items()}
+
+
 @asset(
     description="Load raw customer data from CSV into DuckDB",
     group_name="raw_data",
 )
 def raw_customers(context: AssetExecutionContext, duckdb: DuckDBResource) -> None:
     """Load customer data from CSV into DuckDB."""
-    csv_path = Path("data/raw/customers.csv").absolute()
-    
-    context.log.info(f"Loading customers from {csv_path}")
-    duckdb.read_csv_to_table(str(csv_path), "raw_customers")
-    
-    # Log row count
-    with duckdb.get_connection() as conn:
-        result = conn.execute("SELECT COUNT(*) FROM raw_customers").fetchone()
-        count = result[0] if result else 0
-        context.log.info(f"Loaded {count} customers")
+    counts = _load_raw_sources(duckdb)
+    context.log.info("Loaded %d customers", counts["raw_customers"])
 
 
 @asset(
@@ -30,16 +60,8 @@ def raw_customers(context: AssetExecutionContext, duckdb: DuckDBResource) -> Non
 )
 def raw_products(context: AssetExecutionContext, duckdb: DuckDBResource) -> None:
     """Load product data from CSV into DuckDB."""
-    csv_path = Path("data/raw/products.csv").absolute()
-    
-    context.log.info(f"Loading products from {csv_path}")
-    duckdb.read_csv_to_table(str(csv_path), "raw_products")
-    
-    # Log row count
-    with duckdb.get_connection() as conn:
-        result = conn.execute("SELECT COUNT(*) FROM raw_products").fetchone()
-        count = result[0] if result else 0
-        context.log.info(f"Loaded {count} products")
+    counts = _load_raw_sources(duckdb)
+    context.log.info("Loaded %d products", counts["raw_products"])
 
 
 @asset(
@@ -48,16 +70,8 @@ def raw_products(context: AssetExecutionContext, duckdb: DuckDBResource) -> None
 )
 def raw_sales(context: AssetExecutionContext, duckdb: DuckDBResource) -> None:
     """Load sales data from CSV into DuckDB."""
-    csv_path = Path("data/raw/sales.csv").absolute()
-    
-    context.log.info(f"Loading sales from {csv_path}")
-    duckdb.read_csv_to_table(str(csv_path), "raw_sales")
-    
-    # Log row count
-    with duckdb.get_connection() as conn:
-        result = conn.execute("SELECT COUNT(*) FROM raw_sales").fetchone()
-        count = result[0] if result else 0
-        context.log.info(f"Loaded {count} sales records")
+    counts = _load_raw_sources(duckdb)
+    context.log.info("Loaded %d sales records", counts["raw_sales"])
 
 
 def get_assets():
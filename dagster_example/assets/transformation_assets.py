@@ -1,5 +1,7 @@
 """Transformation assets showing data cleaning and joining."""
 
+import shutil
+
 import pandas as pd
 from dagster import asset, AssetExecutionContext
 from dagster_example.resources import DuckDBResource
@@ -14,37 +16,67 @@ def enriched_sales(
     context: AssetExecutionContext,
     duckdb: DuckDBResource,
 ) -> None:
-    """Join sales with products and customers to create enriched sales table."""
-    
-    query = """
-    CREATE OR REPLACE TABLE enriched_sales AS
-    SELECT 
-        s.sale_id,
-        s.sale_date,
-        s.quantity,
-        c.customer_id,
-        c.name as customer_name,
-        c.city,
-        c.state,
-        p.product_id,
-        p.product_name,
-        p.category,
-        p.price as unit_price,
-        p.cost as unit_cost,
-        s.quantity * p.price as total_revenue,
-        s.quantity * p.cost as total_cost,
-        s.quantity * (p.price - p.cost) as total_profit
-    FROM raw_sales s
-    JOIN raw_products p ON s.product_id = p.product_id
-    JOIN raw_customers c ON s.customer_id = c.customer_id
+    """Join sales with products and customers into enriched sales data.
+
+    The join result is written once as Hive-partitioned Parquet (one
+    directory per month) and exposed through a view over read_parquet.
+    Downstream aggregations get filter/projection pushdown through the
+    view, and any query filtering on month skips entire partition files.
     """
-    
-    context.log.info("Creating enriched sales table")
+
+    warehouse_dir = "data/warehouse/enriched_sales"
+
+    copy_query = f"""
+    COPY (
+        SELECT
+            s.sale_id,
+            s.sale_date,
+            s.quantity,
+            c.customer_id,
+            c.name as customer_name,
+            c.city,
+            c.state,
+            p.product_id,
+            p.product_name,
+            p.category,
+            p.price as unit_price,
+            p.cost as unit_cost,
+            s.quantity * p.price as total_revenue,
+            s.quantity * p.cost as total_cost,
+            s.quantity * (p.price - p.cost) as total_profit,
+            date_trunc('month', s.sale_date)::DATE as month
+        FROM raw_sales s
+        JOIN raw_products p ON s.product_id = p.product_id
+        JOIN raw_customers c ON s.customer_id = c.customer_id
+    ) TO '{warehouse_dir}' (FORMAT PARQUET, PARTITION_BY (month), OVERWRITE)
+    """
+
+    view_query = f"""
+    CREATE OR REPLACE VIEW enriched_sales AS
+    SELECT * FROM read_parquet(
+        '{warehouse_dir}/month=*/*.parquet',
+        hive_partitioning = 1,
+        hive_types = {{'month': DATE}}
+    )
+    """
+
+    context.log.info("Creating enriched sales partitions")
+    # Clear the old partition tree first: OVERWRITE only replaces files for
+    # months present in the new result, so a month that disappeared from
+    # the source would otherwise keep serving stale rows through the view
+    shutil.rmtree(warehouse_dir, ignore_errors=True)
     with duckdb.get_connection() as conn:
-        conn.execute(query)
-        result = conn.execute("SELECT COUNT(*) FROM enriched_sales").fetchone()
+        # Drop any table left over from when this asset was materialized
+        exists = conn.execute(
+            "SELECT 1 FROM duckdb_tables() WHERE table_name = 'enriched_sales'"
+        ).fetchone()
+        if exists:
+            conn.execute("DROP TABLE enriched_sales")
+
+        result = conn.execute(copy_query).fetchone()
         count = result[0] if result else 0
-        context.log.info(f"Created enriched sales table with {count} records")
+        conn.execute(view_query)
+        context.log.info("Wrote %d enriched sales records to %s", count, warehouse_dir)
 
 
 @asset(
@@ -75,19 +107,17 @@ def product_metrics(
     
     context.log.info("Calculating product metrics")
     with duckdb.get_connection() as conn:
-        conn.execute(query)
-        
-        # Log some insights
-        top_margin = conn.execute("""
-            SELECT product_name, margin_percentage 
-            FROM product_metrics 
-            ORDER BY margin_percentage DESC 
+        # Fuse the insight lookup into the same round trip as the write
+        top_margin = conn.execute(query + """;
+            SELECT product_name, margin_percentage
+            FROM product_metrics
+            ORDER BY margin_percentage DESC
             LIMIT 1
         """).fetchone()
-        
+
         top_margin = top_margin if top_margin else ("N/A", 0)
         context.log.info(
-            f"Highest margin product: {top_margin[0]} ({top_margin[1]}%)"
+            "Highest margin product: %s (%s%%)", top_margin[0], top_margin[1]
         )
 
 
@@ -1,6 +1,6 @@
 """Jobs for orchestrating asset materializations."""
 
-from dagster import AssetSelection, define_asset_job
+from dagster import AssetSelection, define_asset_job, in_process_executor
 
 
 # Job that materializes all analytics assets
@@ -8,6 +8,9 @@ daily_analytics_job = define_asset_job(
     name="daily_analytics_job",
     description="Daily job to refresh all analytics tables",
     selection=AssetSelection.groups("raw_data", "transformed_data", "analytics"),
+    # Run in-process so all assets share one DuckDB connection and rely on
+    # DuckDB's own MVCC instead of cross-process file locking
+    executor_def=in_process_executor,
 )
 
 
@@ -16,6 +19,7 @@ etl_job = define_asset_job(
     name="etl_job",
     description="ETL pipeline: raw data -> transformed data",
     selection=AssetSelection.groups("raw_data", "transformed_data"),
+    executor_def=in_process_executor,
 )
 
 
@@ -1,88 +1,185 @@
 """DuckDB resource for Dagster."""
 
 import os
-import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 from contextlib import contextmanager
-import time
 
 import duckdb
 from dagster import ConfigurableResource
 
-# Cross-platform file locking
-if sys.platform == "win32":
-    import msvcrt
-else:
-    import fcntl
+
+# Process-wide pool of long-lived connections, keyed by database path.
+# Opening a DuckDB database is expensive (catalog load, WAL replay), so each
+# path gets one persistent connection and every asset step borrows a cursor
+# from it instead of reopening the file.
+_MAX_POOLED_CONNECTIONS = 4
+
+_pool_lock = threading.Lock()
+_pool: "OrderedDict[str, duckdb.DuckDBPyConnection]" = OrderedDict()
+
+
+def _configure_connection(
+    conn: duckdb.DuckDBPyConnection,
+    database_path: str,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
+) -> None:
+    """Apply analytics-friendly settings to a freshly opened connection.
+
+    Runs once per pooled connection, so the cost is amortized over every
+    asset step that borrows a cursor from it.
+    """
+    # Load the Parquet extension up front (a no-op when statically built in)
+    # so no asset step pays install/load cost mid-query
+    conn.execute("LOAD parquet")
+    conn.execute(f"PRAGMA threads={threads or os.cpu_count()}")
+    conn.execute(f"PRAGMA memory_limit='{memory_limit or '8GB'}'")
+    # Asset queries either aggregate or sort explicitly, so insertion order
+    # is free to give up in exchange for fully parallel table writes
+    conn.execute("PRAGMA preserve_insertion_order=false")
+    # Cache Parquet footers/metadata so repeated scans of the raw and
+    # warehouse files skip re-parsing them
+    conn.execute("PRAGMA enable_object_cache")
+    if database_path != ":memory:":
+        tmp_dir = Path(database_path).parent / ".tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        conn.execute(f"PRAGMA temp_directory='{tmp_dir}'")
+
+
+def _pooled_connection(
+    database_path: str,
+    threads: Optional[int] = None,
+    memory_limit: Optional[str] = None,
+) -> duckdb.DuckDBPyConnection:
+    """Return the long-lived connection for a database, creating it if needed."""
+    with _pool_lock:
+        conn = _pool.get(database_path)
+        if conn is not None:
+            _pool.move_to_end(database_path)
+            return conn
+
+        conn = duckdb.connect(database_path, read_only=False)
+        _configure_connection(conn, database_path, threads, memory_limit)
+        _pool[database_path] = conn
+
+        # Bound the pool: evict the least-recently-used connection
+        while len(_pool) > _MAX_POOLED_CONNECTIONS:
+            _, stale = _pool.popitem(last=False)
+            stale.close()
+
+        return conn
 
 
 class DuckDBResource(ConfigurableResource):
-    """A resource for connecting to DuckDB with proper concurrency handling."""
-    
+    """A resource for connecting to DuckDB via a shared in-process connection."""
+
     database_path: str = "data/warehouse/analytics.duckdb"
-    
-    def _lock_file(self, file_handle):
-        """Lock a file (platform-specific implementation)."""
-        if sys.platform == "win32":
-            # Windows: lock the first byte of the file
-            msvcrt.locking(file_handle.fileno(), msvcrt.LK_LOCK, 1)
-        else:
-            # Unix/Linux/Mac: use fcntl
-            fcntl.flock(file_handle.fileno(), fcntl.LOCK_EX)
-    
-    def _unlock_file(self, file_handle):
-        """Unlock a file (platform-specific implementation)."""
-        if sys.platform == "win32":
-            # Windows: unlock the first byte
-            msvcrt.locking(file_handle.fileno(), msvcrt.LK_UNLCK, 1)
-        else:
-            # Unix/Linux/Mac: use fcntl
-            fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
-    
+
+    # Override these in constrained environments (CI, parallel test runs)
+    # where DuckDB's defaults of one thread per core and a large memory
+    # budget would oversubscribe the machine. None keeps the defaults.
+    threads: Optional[int] = None
+    memory_limit: Optional[str] = None
+
     @contextmanager
     def get_connection(self):
-        """Get a DuckDB connection with proper concurrency handling.
-        
-        Uses file-based locking to serialize database access across
-        multiple processes (Dagster's multiprocess executor).
-        Works on both Windows and Unix-like systems.
+        """Get a cursor on the process-wide DuckDB connection.
+
+        The underlying connection stays open for the life of the process
+        and DuckDB's MVCC handles concurrent readers/writers within it.
+        Each caller gets an isolated cursor (its own statement handle and
+        transaction state), so concurrent asset threads can safely share
+        the connection without any external locking.
         """
         # Ensure directory exists
-        db_path = Path(self.database_path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Use a lock file to coordinate access across processes
-        lock_file_path = str(db_path) + ".lock"
-        lock_file = open(lock_file_path, 'w')
-        
+        if self.database_path != ":memory:":
+            Path(self.database_path).parent.mkdir(parents=True, exist_ok=True)
+
+        cursor = _pooled_connection(
+            self.database_path, self.threads, self.memory_limit
+        ).cursor()
         try:
-            # Acquire exclusive lock (blocks until available)
-            self._lock_file(lock_file)
-            
-            # Now we have exclusive access - connect to DuckDB
-            conn = duckdb.connect(str(db_path), read_only=False)
+            yield cursor
+        finally:
             try:
-                yield conn
-            finally:
-                conn.close()
+                # Flush the WAL so blocks freed by CREATE OR REPLACE are
+                # reclaimed instead of growing the database file with every
+                # run; non-blocking for concurrent readers on DuckDB >= 1.5
+                cursor.execute("CHECKPOINT")
+            except duckdb.TransactionException:
+                # Another cursor is mid-write; its own release will checkpoint
+                pass
+            cursor.close()
+
+    def stream_query(self, query: str, rows_per_batch: int = 10_000):
+        """Execute a query and stream results as Arrow record batches.
+
+        Memory stays bounded by rows_per_batch regardless of result size;
+        callers iterate the returned reader with `for batch in ...`.
+        """
+        # Bypass get_connection: its checkpoint-on-release would run another
+        # statement on the cursor and discard the pending streamed result
+        cursor = _pooled_connection(
+            self.database_path, self.threads, self.memory_limit
+        ).cursor()
+        try:
+            return cursor.execute(query).to_arrow_reader(rows_per_batch)
         finally:
-            # Release the lock
-            self._unlock_file(lock_file)
-            lock_file.close()
-    
-    def execute_query(self, query: str):
-        """Execute a query and return results."""
+            cursor.close()
+
+    def fetch_all_arrow(self, query: str):
+        """Execute a query and return the full result as a pyarrow Table.
+
+        Arrow shares DuckDB's columnar layout, so results transfer without
+        boxing every cell into a Python object the way fetchall() does.
+        Callers that want plain rows can use .to_pylist() on the result.
+        """
         with self.get_connection() as conn:
-            result = conn.execute(query).fetchall()
-            return result
-    
-    def read_csv_to_table(self, csv_path: str, table_name: str) -> None:
-        """Load a CSV file into a DuckDB table."""
+            return conn.execute(query).to_arrow_table()
+
+    def read_source_to_table(self, csv_path: str, table_name: str) -> int:
+        """Expose a source file as a DuckDB relation, converting CSV to Parquet once.
+
+        The CSV is parsed a single time and written out as ZSTD-compressed
+        Parquet next to it; the Parquet copy is refreshed only when the CSV
+        is newer. The table itself becomes a view over the Parquet file, so
+        queries scan the columnar file directly (with projection/filter
+        pushdown) instead of re-materializing the data.
+
+        Returns the row count, answered from Parquet metadata without a scan,
+        so callers don't need a follow-up COUNT(*) query.
+        """
+        csv_file = Path(csv_path)
+        parquet_file = csv_file.with_suffix(".parquet")
+
         with self.get_connection() as conn:
-            conn.execute(f"""
-                CREATE OR REPLACE TABLE {table_name} AS 
-                SELECT * FROM read_csv_auto('{csv_path}')
-            """)
+            if (
+                not parquet_file.exists()
+                or parquet_file.stat().st_mtime < csv_file.stat().st_mtime
+            ):
+                conn.execute(f"""
+                    COPY (SELECT * FROM read_csv_auto('{csv_file}'))
+                    TO '{parquet_file}' (FORMAT PARQUET, COMPRESSION ZSTD)
+                """)
+
+            # Drop any table left over from the old CSV-materialization path
+            # so the view can take its name
+            exists = conn.execute(
+                "SELECT 1 FROM duckdb_tables() WHERE table_name = ?", [table_name]
+            ).fetchone()
+            if exists:
+                conn.execute(f"DROP TABLE {table_name}")
+
+            # Fuse the view creation and the row count into one round trip;
+            # COUNT(*) over Parquet is served from file metadata
+            result = conn.execute(f"""
+                CREATE OR REPLACE VIEW {table_name} AS
+                SELECT * FROM '{parquet_file}';
+                SELECT COUNT(*) FROM {table_name}
+            """).fetchone()
             # Commit to ensure data is written
             conn.commit()
+            return result[0] if result else 0
@@ -1,32 +1,40 @@
 """Sensors for event-driven pipelines."""
 
 import os
+import threading
 from pathlib import Path
 from dagster import sensor, RunRequest, SensorEvaluationContext, SkipReason
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
 from dagster_example.jobs import etl_job
 
 
+RAW_DATA_DIR = Path("data/raw")
+RAW_FILE_NAMES = {"sales.csv", "customers.csv", "products.csv"}
+
+
 @sensor(
     job=etl_job,
     description="Trigger ETL when new sales CSV files are detected",
 )
 def sales_file_sensor(context: SensorEvaluationContext):
     """Watch for new or modified sales CSV files."""
-    
+
     sales_file = Path("data/raw/sales.csv")
-    
+
     if not sales_file.exists():
         return SkipReason("Sales file does not exist")
-    
+
     # Get last modified time
     last_modified = sales_file.stat().st_mtime
-    
+
     # Check cursor (last processed time)
     cursor = float(context.cursor) if context.cursor else 0
-    
+
     if last_modified > cursor:
-        context.log.info(f"Detected updated sales file (modified: {last_modified})")
-        
+        context.log.info("Detected updated sales file (modified: %s)", last_modified)
+
         return RunRequest(
             run_key=f"sales_update_{last_modified}",
             run_config={},
@@ -35,6 +43,65 @@ def sales_file_sensor(context: SensorEvaluationContext):
         return SkipReason("No new updates to sales file")
 
 
+class _RawFileWatcher(FileSystemEventHandler):
+    """Tracks the most recent modification across the raw data files.
+
+    Filesystem events from watchdog update the shared state, so sensor
+    evaluations read a cached mtime instead of stat()-ing every file on
+    every tick.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest_mtime = 0.0
+        self._modified_files = []
+
+    def record(self, file_path: Path):
+        if file_path.name not in RAW_FILE_NAMES or not file_path.exists():
+            return
+        mtime = file_path.stat().st_mtime
+        with self._lock:
+            if mtime > self._latest_mtime:
+                self._latest_mtime = mtime
+                self._modified_files.append(file_path.name)
+
+    def on_created(self, event):
+        self.record(Path(event.src_path))
+
+    def on_modified(self, event):
+        self.record(Path(event.src_path))
+
+    def snapshot(self):
+        """Return (latest_mtime, modified_files) and clear the file list."""
+        with self._lock:
+            latest, modified = self._latest_mtime, self._modified_files
+            self._modified_files = []
+            return latest, modified
+
+
+_watcher: "_RawFileWatcher | None" = None
+_watcher_lock = threading.Lock()
+
+
+def _get_watcher():
+    """Start the process-wide raw-file watcher on first use."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            handler = _RawFileWatcher()
+            # Seed with current mtimes so changes made while no watcher was
+            # running are still picked up against the cursor
+            for name in RAW_FILE_NAMES:
+                handler.record(RAW_DATA_DIR / name)
+
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(handler, str(RAW_DATA_DIR))
+            observer.start()
+            _watcher = handler
+        return _watcher
+
+
 # Example of a more complex sensor
 @sensor(
     job=etl_job,
@@ -43,32 +110,22 @@ def sales_file_sensor(context: SensorEvaluationContext):
 )
 def multi_file_sensor(context: SensorEvaluationContext):
     """Watch for updates to any raw data file."""
-    
-    raw_files = [
-        Path("data/raw/sales.csv"),
-        Path("data/raw/customers.csv"),
-        Path("data/raw/products.csv"),
-    ]
-    
-    latest_modified = 0
-    modified_files = []
-    
-    for file_path in raw_files:
-        if file_path.exists():
-            mtime = file_path.stat().st_mtime
-            if mtime > latest_modified:
-                latest_modified = mtime
-                modified_files.append(file_path.name)
-    
+
+    if not RAW_DATA_DIR.exists():
+        return SkipReason("Raw data directory does not exist")
+
+    latest_modified, modified_files = _get_watcher().snapshot()
+
     cursor = float(context.cursor) if context.cursor else 0
-    
+
     if latest_modified > cursor:
-        context.log.info(f"Detected updates in: {', '.join(modified_files)}")
+        if modified_files:
+            context.log.info("Detected updates in: %s", ", ".join(modified_files))
         context.update_cursor(str(latest_modified))
-        
+
         return RunRequest(
             run_key=f"multi_file_update_{latest_modified}",
             run_config={},
         )
-    
+
     return SkipReason("No updates to raw data files")
@@ -18,10 +18,10 @@ The script:
 
 from __future__ import annotations
 
-import random
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 
@@ -56,8 +56,7 @@ def generate_missing_sales(
     seed: int | None = 42,
 ) -> pd.DataFrame:
     """Return an extended sales DataFrame with at least one sale per day."""
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # Ensure sale_date is datetime.date
     if not sales.empty:
@@ -66,10 +65,9 @@ def generate_missing_sales(
 
     # All days in the desired period
     all_dates = pd.date_range(start_date, end_date, freq="D").date
-    existing_dates = set(sales["sale_date"]) if not sales.empty else set()
 
-    customer_ids = customers["customer_id"].tolist()
-    product_ids = products["product_id"].tolist()
+    customer_ids = customers["customer_id"].to_numpy()
+    product_ids = products["product_id"].to_numpy()
 
     # Start sale_id after the current max, or at 1001 if empty
     if not sales.empty and "sale_id" in sales.columns:
@@ -77,34 +75,31 @@ def generate_missing_sales(
     else:
         next_sale_id = 1001
 
-    new_rows = []
-
-    for d in all_dates:
-        if d in existing_dates:
-            # Already have at least one sale this day; skip
-            continue
-
-        # Random number of sales for this day
-        num_sales = random.randint(1, 5)
-
-        for _ in range(num_sales):
-            cid = random.choice(customer_ids)
-            pid = random.choice(product_ids)
-            qty = random.randint(1, 5)
-
-            new_rows.append(
-                {
-                    "sale_id": next_sale_id,
-                    "customer_id": cid,
-                    "product_id": pid,
-                    "quantity": qty,
-                    "sale_date": d,
-                }
-            )
-            next_sale_id += 1
-
-    if new_rows:
-        new_sales = pd.DataFrame(new_rows)
+    # Days that still need at least one sale: a C-level hash-set difference
+    # instead of a Python set lookup per day
+    if not sales.empty:
+        missing_dates = (
+            pd.Index(all_dates).difference(sales["sale_date"].unique()).to_numpy()
+        )
+    else:
+        missing_dates = np.asarray(all_dates, dtype=object)
+
+    if len(missing_dates) > 0:
+        # Draw all random values in bulk instead of per-row Python calls:
+        # a sale count per missing day, then one flat batch of sales
+        counts = rng.integers(1, 6, size=len(missing_dates))
+        total = int(counts.sum())
+
+        new_sales = pd.DataFrame(
+            {
+                "sale_id": np.arange(next_sale_id, next_sale_id + total),
+                "customer_id": rng.choice(customer_ids, size=total),
+                "product_id": rng.choice(product_ids, size=total),
+                "quantity": rng.integers(1, 6, size=total),
+                "sale_date": np.repeat(missing_dates, counts),
+            }
+        )
+
         # Combine existing + new
         if sales.empty:
             sales_extended = new_sales
@@ -118,9 +113,7 @@ def generate_missing_sales(
     sales_extended = sales_extended.sort_values(["sale_date", "sale_id"]).reset_index(drop=True)
 
     # Convert sale_date back to ISO string for CSV
-    sales_extended["sale_date"] = sales_extended["sale_date"].apply(
-        lambda d: d.isoformat() if isinstance(d, (date, datetime)) else str(d)
-    )
+    sales_extended["sale_date"] = sales_extended["sale_date"].astype(str)
 
     return sales_extended
 
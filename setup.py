@@ -7,8 +7,10 @@ setup(
     install_requires=[
         "dagster>=1.5.0",
         "dagster-webserver>=1.5.0",
-        "duckdb>=0.9.0",
+        "duckdb>=1.5.0",
         "pandas>=2.0.0",
+        "pyarrow>=14.0.0",
+        "watchdog>=4.0.0",
     ],
     extras_require={
         "dev": [
@@ -1,40 +1,68 @@
-"""Test concurrent asset materialization to verify lock fix."""
+"""Test concurrent asset materialization to verify lock fix.
 
-from dagster import materialize
+Dagster's `materialize()` runs steps serially in one process, and the
+multiprocess executor can't share a DuckDB file (one writing process per
+database), so the three independent raw assets are driven concurrently
+from threads instead: each thread materializes one asset against the
+shared DuckDBResource, borrowing its own cursor from the pooled
+connection while DuckDB's MVCC handles the concurrent writes.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dagster import build_asset_context
 from dagster_example.resources import DuckDBResource
 from dagster_example.assets.basic_assets import raw_customers, raw_products, raw_sales
 
-# Clean start
-import os
+# Clean start: one directory scan catches the database and whatever
+# sidecar names this DuckDB version uses (.wal, -wal, .tmp, .lock)
 db_path = "data/warehouse/analytics.duckdb"
-for ext in ["", ".wal", "-wal"]:
-    try:
-        os.remove(db_path + ext)
-    except FileNotFoundError:
-        pass
+base = Path(db_path)
+for leftover in base.parent.iterdir():
+    if leftover.name.startswith(base.name):
+        leftover.unlink(missing_ok=True)
 
 print("Testing concurrent asset materialization with DuckDB lock fix...\n")
 
-# Materialize all three assets - Dagster will run them in parallel
-result = materialize(
-    [raw_customers, raw_products, raw_sales],
-    resources={
-        "duckdb": DuckDBResource(database_path=db_path)
-    },
-)
-
-if result.success:
-    print("\n✅ SUCCESS! All assets materialized without lock conflicts!")
-    
+duckdb_resource = DuckDBResource(database_path=db_path)
+
+
+def materialize_asset(asset_def):
+    """Run one asset in its own thread with its own execution context."""
+    # Entering the context here (rather than letting it leak) makes
+    # resource teardown happen now instead of at interpreter shutdown
+    with build_asset_context() as context:
+        asset_def(context, duckdb_resource)
+    return asset_def.key.to_user_string()
+
+
+# Materialize all three assets concurrently - each thread gets its own cursor
+with ThreadPoolExecutor(max_workers=3) as executor:
+    futures = [
+        executor.submit(materialize_asset, asset_def)
+        for asset_def in (raw_customers, raw_products, raw_sales)
+    ]
+    try:
+        materialized = [future.result() for future in futures]
+    except Exception as e:
+        materialized = None
+        print(f"\n❌ Materialization failed: {e}")
+
+if materialized:
+    print(f"\n✅ SUCCESS! Assets {', '.join(sorted(materialized))} "
+          "materialized without lock conflicts!")
+
     # Verify data
     import duckdb
     conn = duckdb.connect(db_path)
     tables = conn.execute('SHOW TABLES').fetchall()
     print("\nVerifying database contents:")
     for table in tables:
-        count = conn.execute(f'SELECT COUNT(*) FROM {table[0]}').fetchone()[0]
+        # Quote the identifier so odd table names can't break (or inject
+        # into) the pasted statement
+        qname = '"' + table[0].replace('"', '""') + '"'
+        count = conn.execute(f'SELECT COUNT(*) FROM {qname}').fetchone()[0]
         print(f'  • {table[0]}: {count} rows')
     conn.close()
     print("\n🎉 The DuckDB concurrency fix is working!")
-else:
-    print("\n❌ Materialization failed")
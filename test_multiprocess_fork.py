@@ -0,0 +1,68 @@
+"""Test multiprocess access with per-process pooled DuckDB connections."""
+
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from dagster_example.resources import DuckDBResource
+
+# How many workloads each worker runs against its pooled connection
+WORKLOADS_PER_WORKER = 5
+
+# Per-process resource, created once by the pool initializer so every
+# workload in the same process reuses the same pooled connection instead
+# of re-opening the database
+_resource = None
+
+
+def init_worker(db_path):
+    """Pool initializer: open this process's database once.
+
+    DuckDB allows only one writing process per database file, so each
+    worker process gets its own file derived from the base path; within
+    the process, the connection pool in DuckDBResource keeps it open for
+    every subsequent workload.
+    """
+    global _resource
+    _resource = DuckDBResource(database_path=f"{db_path}.{os.getpid()}")
+
+
+def worker(worker_id):
+    """Worker function that runs several workloads on the pooled connection."""
+    print(f"[Worker {worker_id}] Starting (PID: {multiprocessing.current_process().pid})")
+
+    start = time.perf_counter()
+    for _ in range(WORKLOADS_PER_WORKER):
+        with _resource.get_connection() as conn:
+            # One explicit transaction per workload: a single WAL flush and
+            # MVCC snapshot instead of one per statement
+            conn.execute("BEGIN")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS test_{worker_id} (id INT)")
+            conn.execute(f"INSERT INTO test_{worker_id} VALUES ({worker_id})")
+            result = conn.execute(f"SELECT COUNT(*) FROM test_{worker_id}").fetchone()
+            conn.execute("COMMIT")
+    elapsed = time.perf_counter() - start
+
+    print(f"[Worker {worker_id}] Ran {WORKLOADS_PER_WORKER} workloads in {elapsed:.3f}s, "
+          f"table has {result[0]} rows")
+    return worker_id
+
+
+if __name__ == "__main__":
+    db_path = "data/warehouse/test_multiprocess.duckdb"
+
+    # Clean up databases left over from previous runs: one directory scan
+    # catches the base file, sidecars, and every per-PID database
+    base = Path(db_path)
+    for leftover in base.parent.iterdir():
+        if leftover.name.startswith(base.name):
+            leftover.unlink(missing_ok=True)
+
+    print("Testing pooled connection reuse across multiple processes...\n")
+
+    # Each process opens its database once and reuses the connection
+    with multiprocessing.Pool(processes=3, initializer=init_worker, initargs=(db_path,)) as pool:
+        results = pool.map(worker, range(3))
+
+    print(f"\n✅ All {len(results)} workers completed successfully!")
+    print("Per-process connection pooling is working! 🎉")
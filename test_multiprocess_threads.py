@@ -0,0 +1,59 @@
+"""Test concurrent access with threads sharing one pooled DuckDB connection.
+
+Threads skip the fork + interpreter-start cost that test_multiprocess_fork.py
+pays per worker, and DuckDB releases the GIL during query execution, so this
+demonstrates the same concurrency at a fraction of the startup cost. Each
+thread still gets its own cursor (statement handle and transaction state)
+through DuckDBResource.get_connection().
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from dagster_example.resources import DuckDBResource
+
+# How many workloads each worker runs against the shared connection
+WORKLOADS_PER_WORKER = 5
+
+# One resource shared by every thread; the pool behind it keeps a single
+# connection open and hands each thread an isolated cursor
+_resource = DuckDBResource(database_path="data/warehouse/test_multiprocess_threads.duckdb")
+
+
+def worker(worker_id):
+    """Worker function that runs several workloads on a per-thread cursor."""
+    print(f"[Worker {worker_id}] Starting (thread: {threading.current_thread().name})")
+
+    start = time.perf_counter()
+    for _ in range(WORKLOADS_PER_WORKER):
+        with _resource.get_connection() as conn:
+            # One explicit transaction per workload: a single WAL flush and
+            # MVCC snapshot instead of one per statement
+            conn.execute("BEGIN")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS test_{worker_id} (id INT)")
+            conn.execute(f"INSERT INTO test_{worker_id} VALUES ({worker_id})")
+            result = conn.execute(f"SELECT COUNT(*) FROM test_{worker_id}").fetchone()
+            conn.execute("COMMIT")
+    elapsed = time.perf_counter() - start
+
+    print(f"[Worker {worker_id}] Ran {WORKLOADS_PER_WORKER} workloads in {elapsed:.3f}s, "
+          f"table has {result[0]} rows")
+    return worker_id
+
+
+if __name__ == "__main__":
+    db_path = Path("data/warehouse/test_multiprocess_threads.duckdb")
+
+    # Clean up databases left over from previous runs with one directory scan
+    for leftover in db_path.parent.iterdir():
+        if leftover.name.startswith(db_path.name):
+            leftover.unlink(missing_ok=True)
+
+    print("Testing threaded cursors on one shared connection...\n")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(worker, range(3)))
+
+    print(f"\n✅ All {len(results)} workers completed successfully!")
+    print("Per-thread cursors on a shared connection are working! 🎉")
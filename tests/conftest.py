@@ -0,0 +1,37 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from dagster_example.assets.basic_assets import _load_raw_sources
+from dagster_example.resources import DuckDBResource
+
+
+@pytest.fixture(scope="session")
+def duckdb_resource():
+    """One in-memory DuckDBResource shared across the whole test session.
+
+    Creating the resource per test paid database-init and setup cost every
+    time; the pooled connection behind the resource makes sharing safe, and
+    the assets under test recreate their tables with CREATE OR REPLACE so
+    tests stay independent of ordering. Threads and memory are pinned low
+    so parallel test runs don't oversubscribe the machine.
+
+    The raw sources are warmed once up front: the first load converts any
+    stale CSV to its Parquet copy, so every per-test materialization is
+    just a cheap view refresh over columnar data instead of a CSV parse.
+    """
+    resource = DuckDBResource(database_path=":memory:", threads=2, memory_limit="256MB")
+    _load_raw_sources(resource)
+    return resource
+
+
+@pytest.fixture(scope="session")
+def defs():
+    """The project's Dagster Definitions, loaded once per session.
+
+    Importing dagster_example triggers a full repository load (asset
+    registration, dependency-graph resolution, type checks); with session
+    scope every test shares that one load instead of repeating it.
+    """
+    from dagster_example import defs as _defs
+
+    return _defs
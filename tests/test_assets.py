@@ -6,34 +6,31 @@ Run with: pytest tests/
 
 import pytest
 from dagster import build_asset_context, materialize
-from dagster_example.resources import DuckDBResource
 from dagster_example.assets.basic_assets import raw_customers, raw_products, raw_sales
 
 
-def test_raw_customers_asset():
+def test_raw_customers_asset(duckdb_resource):
     """Test that raw_customers asset can be materialized."""
     context = build_asset_context()
-    duckdb = DuckDBResource(database_path=":memory:")
-    
+
     # Should not raise an exception
-    raw_customers(context, duckdb)
-    
+    raw_customers(context, duckdb_resource)
+
     # Verify table was created
-    with duckdb.get_connection() as conn:
+    with duckdb_resource.get_connection() as conn:
         result = conn.execute("SELECT COUNT(*) FROM raw_customers").fetchone()
         if result:
             assert result[0] > 0, "Should have loaded customer data"
         else:
             pytest.fail("raw_customers table does not exist")
 
-def test_raw_products_asset():
+def test_raw_products_asset(duckdb_resource):
     """Test that raw_products asset can be materialized."""
     context = build_asset_context()
-    duckdb = DuckDBResource(database_path=":memory:")
-    
-    raw_products(context, duckdb)
-    
-    with duckdb.get_connection() as conn:
+
+    raw_products(context, duckdb_resource)
+
+    with duckdb_resource.get_connection() as conn:
         result = conn.execute("SELECT COUNT(*) FROM raw_products").fetchone()
         if result:
             assert result[0] > 0, "Should have loaded product data"
@@ -41,25 +38,22 @@ def test_raw_products_asset():
             pytest.fail("raw_products table does not exist")
 
 
-def test_raw_sales_asset():
+def test_raw_sales_asset(duckdb_resource):
     """Test that raw_sales asset can be materialized."""
     context = build_asset_context()
-    duckdb = DuckDBResource(database_path=":memory:")
-    
-    raw_sales(context, duckdb)
-    
-    with duckdb.get_connection() as conn:
+
+    raw_sales(context, duckdb_resource)
+
+    with duckdb_resource.get_connection() as conn:
         result = conn.execute("SELECT COUNT(*) FROM raw_sales").fetchone()
         if result:
             assert result[0] > 0, "Should have loaded sales data"
         else:
             pytest.fail("raw_sales table does not exist")
 
-def test_duckdb_resource():
+def test_duckdb_resource(duckdb_resource):
     """Test DuckDB resource functionality."""
-    duckdb = DuckDBResource(database_path=":memory:")
-    
-    with duckdb.get_connection() as conn:
+    with duckdb_resource.get_connection() as conn:
         # Test basic query
         result = conn.execute("SELECT 1 + 1 as sum").fetchone()
         if result:
@@ -67,14 +61,12 @@ def test_duckdb_resource():
 
 
 # Integration test example
-def test_full_pipeline():
+def test_full_pipeline(defs, duckdb_resource):
     """Test materializing multiple dependent assets."""
-    from dagster_example import defs
-    
     # Materialize just the raw data assets
     result = materialize(
         [raw_customers, raw_products, raw_sales],
-        resources={"duckdb": DuckDBResource(database_path=":memory:")},
+        resources={"duckdb": duckdb_resource},
     )
-    
+
     assert result.success, "Pipeline should complete successfully"